@@ -37,6 +37,9 @@ logger = get_logger()
 # Lifecycle tools that don't require game connection
 LIFECYCLE_TOOLS = {"s1_launch_game", "s1_close_game", "s1_get_game_process_info", "s1_search_s1api_docs"}
 
+# Tools whose handlers take the config as a third argument
+CONFIG_TOOLS = frozenset(game_lifecycle_tools.TOOL_HANDLERS)
+
 
 def can_call_tool(tool_name: str) -> tuple[bool, str]:
     """
@@ -217,7 +220,8 @@ def create_server(config: Config, tcp_client: TcpClient) -> Server:
         
         logger.debug(f"Tool call received: {name} with arguments: {arguments}")
         
-        if name not in all_tool_handlers:
+        handler = all_tool_handlers.get(name)
+        if handler is None:
             logger.error(f"Unknown tool: {name}")
             logger.debug(f"Available tools: {list(all_tool_handlers.keys())}")
             return [TextContent(
@@ -231,12 +235,11 @@ def create_server(config: Config, tcp_client: TcpClient) -> Server:
             logger.warning(f"Tool {name} called but game not connected")
             return [TextContent(type="text", text=error_msg)]
         
-        handler = all_tool_handlers[name]
         logger.debug(f"Found handler for {name}, invoking...")
         
         try:
             # Game lifecycle tools need config parameter
-            if name.startswith("s1_launch_game") or name.startswith("s1_close_game") or name.startswith("s1_get_game_process_info"):
+            if name in CONFIG_TOOLS:
                 result = await handler(arguments, tcp_client, config)
             else:
                 result = await handler(arguments, tcp_client)
@@ -0,0 +1,44 @@
+"""Result payload shapes returned by the mod for specific methods.
+
+Fields are optional (``total=False``) unless the client relies on them being
+present, since older mod builds may omit them.
+"""
+
+from typing import Any, Dict, List, TypedDict
+
+
+class _ListSavesResultBase(TypedDict):
+    saves: List[Dict[str, Any]]
+
+
+class ListSavesResult(_ListSavesResultBase, total=False):
+    """Result of the list_saves method."""
+
+    count: int
+
+
+class LoadSaveResult(TypedDict, total=False):
+    """Result of the load_save method."""
+
+    success: bool
+    slot_index: int
+    message: str
+    returned_to_menu: bool
+
+
+class LogLine(TypedDict, total=False):
+    """A single captured log line; continuation lines have no timestamp."""
+
+    line_number: int
+    timestamp: str
+    content: str
+
+
+class CaptureLogsResult(TypedDict, total=False):
+    """Result of the capture_logs method."""
+
+    lines: List[LogLine]
+    total_lines_in_file: int
+    filtered_count: int
+    filters_applied: List[str]
+    warning: str
@@ -84,13 +84,17 @@ def deserialize_response(data: bytes) -> Response:
     logger.debug(f"Extracted JSON payload: {len(json_bytes)} bytes")
     
     json_str = json_bytes.decode('utf-8')
-    logger.debug(f"Decoded JSON string: {len(json_str)} chars")
-    logger.debug(f"JSON content: {json_str[:200]}..." if len(json_str) > 200 else f"JSON content: {json_str}")
+    # Results can be megabytes; only pay for previewing/repr-ing them when debugging
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug(f"Decoded JSON string: {len(json_str)} chars")
+        logger.debug(f"JSON content: {json_str[:200]}..." if len(json_str) > 200 else f"JSON content: {json_str}")
     
     # Parse JSON
     try:
         json_dict = json.loads(json_str)
-        logger.debug(f"Parsed JSON dict: {json_dict}")
+        if debug_enabled:
+            logger.debug(f"Parsed JSON dict: {json_dict}")
     except json.JSONDecodeError as e:
         logger.error(f"JSON decode error: {e}")
         logger.debug(f"Failed JSON string: {json_str}")
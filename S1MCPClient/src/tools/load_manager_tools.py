@@ -1,15 +1,74 @@
 """LoadManager MCP tools for save game management."""
 
-from typing import Any, Dict
+import json
+from typing import Any, Dict, cast
 from mcp.types import Tool, TextContent
 
+from ..models.response import ErrorResponse
+from ..models.results import ListSavesResult, LoadSaveResult
 from ..tcp_client import TcpClient
 from ..utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; fall back to the stdlib encoder
+    orjson = None
+
 
 logger = get_logger()
 
 
+def _error_content(prefix: str, exc: Exception) -> list[TextContent]:
+    """Log an exception raised by a handler and wrap it as a tool result."""
+    logger.error("%s: %s", prefix, exc)
+    return [TextContent(type="text", text=f"Error: {exc}")]
+
+
+def _rpc_error_content(error: ErrorResponse) -> list[TextContent]:
+    """Wrap an error returned by the mod as a tool result."""
+    return [TextContent(type="text", text=f"Error: {error.message} (code: {error.code})")]
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a result compactly for the agent (no pretty-printing)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+# Tool definitions are static, so build them once at import time
+_LOAD_MANAGER_TOOLS: list[Tool] = [
+    Tool(
+        name="s1_list_saves",
+        description="List all available save games with their properties. Returns an array of save game objects with all available metadata.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    ),
+    Tool(
+        name="s1_load_save",
+        description=(
+            "Load a specific save game by slot index. If a save is already loaded (not in menu scene), "
+            "this will automatically return to the menu first before loading the requested save. "
+            "Note: Slot indices are 0-based (use 0 for first save, 1 for second, etc.)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "slot_index": {
+                    "type": "integer",
+                    "description": "The 0-based index of the save slot to load",
+                    "minimum": 0
+                }
+            },
+            "required": ["slot_index"]
+        }
+    )
+]
+
+
 def get_load_manager_tools(tcp_client: TcpClient) -> list[Tool]:
     """
     Get all LoadManager MCP tools.
@@ -20,36 +79,7 @@ def get_load_manager_tools(tcp_client: TcpClient) -> list[Tool]:
     Returns:
         List of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_list_saves",
-            description="List all available save games with their properties. Returns an array of save game objects with all available metadata.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="s1_load_save",
-            description=(
-                "Load a specific save game by slot index. If a save is already loaded (not in menu scene), "
-                "this will automatically return to the menu first before loading the requested save. "
-                "Note: Slot indices are 0-based (use 0 for first save, 1 for second, etc.)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "slot_index": {
-                        "type": "integer",
-                        "description": "The 0-based index of the save slot to load",
-                        "minimum": 0
-                    }
-                },
-                "required": ["slot_index"]
-            }
-        )
-    ]
+    return _LOAD_MANAGER_TOOLS
 
 
 async def handle_s1_list_saves(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
@@ -58,24 +88,20 @@ async def handle_s1_list_saves(arguments: Dict[str, Any], tcp_client: TcpClient)
         response = tcp_client.call_with_retry("list_saves", {})
         
         if response.error:
-            return [TextContent(
-                type="text",
-                text=f"Error: {response.error.message} (code: {response.error.code})"
-            )]
+            return _rpc_error_content(response.error)
         
-        import json
-        result_text = json.dumps(response.result, indent=2)
+        result_text = _dumps(response.result)
         
         # Add helpful summary
         if isinstance(response.result, dict) and "saves" in response.result:
-            save_count = response.result.get("count", 0)
+            result = cast(ListSavesResult, response.result)
+            save_count = result.get("count", 0)
             summary = f"Found {save_count} save game(s):\n\n{result_text}"
             return [TextContent(type="text", text=summary)]
         
         return [TextContent(type="text", text=result_text)]
     except Exception as e:
-        logger.error(f"Error in s1_list_saves: {e}")
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+        return _error_content("Error in s1_list_saves", e)
 
 
 async def handle_s1_load_save(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
@@ -92,16 +118,13 @@ async def handle_s1_load_save(arguments: Dict[str, Any], tcp_client: TcpClient)
         response = tcp_client.call_with_retry("load_save", {"slot_index": slot_index})
         
         if response.error:
-            return [TextContent(
-                type="text",
-                text=f"Error: {response.error.message} (code: {response.error.code})"
-            )]
+            return _rpc_error_content(response.error)
         
         # Format success message
         if isinstance(response.result, dict):
-            success = response.result.get("success", False)
-            message = response.result.get("message", "")
-            returned_to_menu = response.result.get("returned_to_menu", False)
+            result = cast(LoadSaveResult, response.result)
+            message = result.get("message", "")
+            returned_to_menu = result.get("returned_to_menu", False)
             
             status_text = f"✓ {message}"
             if returned_to_menu:
@@ -109,11 +132,9 @@ async def handle_s1_load_save(arguments: Dict[str, Any], tcp_client: TcpClient)
             
             return [TextContent(type="text", text=status_text)]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=_dumps(response.result))]
     except Exception as e:
-        logger.error(f"Error in s1_load_save: {e}")
-        return [TextContent(type="text", text=f"Error: {str(e)}")]
+        return _error_content("Error in s1_load_save", e)
 
 
 # Tool handler mapping
@@ -0,0 +1,76 @@
+"""Unit tests for log capture result formatting."""
+
+import unittest
+
+from src.tools.log_tools import _format_capture_result
+
+
+class TestFormatCaptureResult(unittest.TestCase):
+    """Test cases for _format_capture_result."""
+
+    def _result(self, lines):
+        return {
+            "lines": lines,
+            "total_lines_in_file": 10,
+            "filtered_count": len(lines),
+            "filters_applied": ["keyword: error"],
+        }
+
+    def test_all_lines_stamped(self):
+        """Every line is rendered with its timestamp."""
+        text = _format_capture_result(self._result([
+            {"line_number": 1, "timestamp": "12:30:45.123", "content": "first"},
+            {"line_number": 2, "timestamp": "12:30:46.000", "content": "second"},
+        ]))
+
+        self.assertEqual(
+            text,
+            "📊 Log Summary:\n"
+            "  • Total lines in file: 10\n"
+            "  • Lines after filtering: 2\n"
+            "  • Lines returned: 2\n"
+            "\n🔍 Filters Applied:\n"
+            "  • keyword: error\n"
+            "\n📝 Log Lines:\n\n"
+            "[Line 1] [12:30:45.123] first\n"
+            "[Line 2] [12:30:46.000] second"
+        )
+
+    def test_mixed_timestamps(self):
+        """Continuation lines without a timestamp omit the timestamp brackets."""
+        text = _format_capture_result(self._result([
+            {"line_number": 1, "timestamp": "12:30:45.123", "content": "Exception: boom"},
+            {"line_number": 2, "timestamp": "", "content": "  at Foo.Bar()"},
+            {"line_number": 3, "content": "  at Baz.Qux()"},
+        ]))
+
+        self.assertTrue(text.endswith(
+            "[Line 1] [12:30:45.123] Exception: boom\n"
+            "[Line 2]   at Foo.Bar()\n"
+            "[Line 3]   at Baz.Qux()"
+        ))
+        self.assertNotIn("[]", text)
+
+    def test_no_lines(self):
+        """An empty capture reports that nothing matched."""
+        text = _format_capture_result({
+            "lines": [],
+            "total_lines_in_file": 0,
+            "filtered_count": 0,
+            "filters_applied": [],
+            "warning": "Log file not found",
+        })
+
+        self.assertEqual(
+            text,
+            "⚠️ Warning: Log file not found\n\n"
+            "📊 Log Summary:\n"
+            "  • Total lines in file: 0\n"
+            "  • Lines after filtering: 0\n"
+            "  • Lines returned: 0\n"
+            "\n(No log lines matched the filters)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()